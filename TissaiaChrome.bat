@@ -53,7 +53,7 @@ echo       Found npm v%NPM_VER%
 :: [3] Install dependencies
 :: ===============================================
 echo [3/6] Checking dependencies...
-if exist "node_modules" (
+if exist "node_modules\" (
     echo       Dependencies already installed
 ) else (
     echo       Installing dependencies ^(this may take a few minutes^)...
@@ -123,9 +123,30 @@ echo [5/6] Starting servers ^(minimized to tray^)...
 :: Start backend and frontend servers in a minimized window
 start /min "Tissaia Servers" cmd /c "npm run dev:all:silent"
 
-:: Wait for servers to start
+:: Wait for the dev server to answer instead of sleeping a fixed time
 echo       Waiting for servers to initialize...
-timeout /t 5 /nobreak >nul
+where curl.exe >nul 2>nul
+if %errorlevel% neq 0 (
+    rem No curl ^(pre-1803 Windows^) - fall back to a fixed wait
+    timeout /t 5 /nobreak >nul
+    goto :servers_ready
+)
+set /a WAIT_TRIES=0
+:wait_for_server
+curl.exe -s -o nul -I --max-time 1 http://localhost:5174/
+if %errorlevel% equ 0 (
+    echo       Servers are ready
+    goto :servers_ready
+)
+set /a WAIT_TRIES+=1
+if %WAIT_TRIES% geq 60 (
+    echo       [WARNING] Dev server did not respond in time, launching anyway
+    goto :servers_ready
+)
+timeout /t 1 /nobreak >nul
+goto :wait_for_server
+
+:servers_ready
 
 :: ===============================================
 :: [6] Launch Chrome in App Mode
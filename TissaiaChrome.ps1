@@ -28,7 +28,7 @@ try {
 }
 
 # Install dependencies if needed
-if (-not (Test-Path "node_modules")) {
+if (-not (Test-Path "node_modules" -PathType Container)) {
     Write-Host "  Installing dependencies..." -ForegroundColor Yellow
     npm install
 }
@@ -57,22 +57,73 @@ $ServerProcess = Start-Process -FilePath "npm" -ArgumentList "run", "dev:all:sil
 
 Write-Host "  Servers started (PID: $($ServerProcess.Id))" -ForegroundColor Green
 Write-Host "  Waiting for servers to initialize..." -ForegroundColor Yellow
-Start-Sleep -Seconds 5
 
-# Find Chrome or Edge
+# Probe the dev server with a raw HEAD request, backing off between attempts
+$DevServerPort = 5174
+$WaitTimeout = [TimeSpan]::FromSeconds(60)
+$WaitClock = [System.Diagnostics.Stopwatch]::StartNew()
+$Delay = 50
+$ServerReady = $false
+while ($WaitClock.Elapsed -lt $WaitTimeout) {
+    $Client = New-Object System.Net.Sockets.TcpClient([System.Net.Sockets.AddressFamily]::InterNetworkV6)
+    $Client.Client.DualMode = $true
+    try {
+        if ($Client.ConnectAsync("localhost", $DevServerPort).Wait(200)) {
+            # Port is open - a status line back means the dev server is serving
+            $Stream = $Client.GetStream()
+            $Stream.ReadTimeout = 500
+            $Probe = [System.Text.Encoding]::ASCII.GetBytes("HEAD / HTTP/1.0`r`nHost: localhost`r`n`r`n")
+            $Stream.Write($Probe, 0, $Probe.Length)
+            $Buffer = New-Object byte[] 16
+            $Read = $Stream.Read($Buffer, 0, $Buffer.Length)
+            $ServerReady = [System.Text.Encoding]::ASCII.GetString($Buffer, 0, $Read).StartsWith("HTTP/")
+        }
+    } catch {
+        # Connection refused or no response - server is not ready yet
+    } finally {
+        $Client.Close()
+    }
+    if ($ServerReady) { break }
+    Start-Sleep -Milliseconds $Delay
+    $Delay = [Math]::Min([int]($Delay * 1.5), 1000)
+}
+
+if ($ServerReady) {
+    Write-Host "  Servers are ready" -ForegroundColor Green
+} else {
+    Write-Host "  [WARNING] Dev server did not respond in time, launching anyway" -ForegroundColor Yellow
+}
+
+# Find Chrome or Edge - ask the App Paths registry first, then the usual install locations
 $BrowserPath = $null
-$BrowserPaths = @(
-    "$env:ProgramFiles\Google\Chrome\Application\chrome.exe",
-    "${env:ProgramFiles(x86)}\Google\Chrome\Application\chrome.exe",
-    "$env:LocalAppData\Google\Chrome\Application\chrome.exe",
-    "$env:ProgramFiles\Microsoft\Edge\Application\msedge.exe",
-    "${env:ProgramFiles(x86)}\Microsoft\Edge\Application\msedge.exe"
-)
-
-foreach ($path in $BrowserPaths) {
-    if (Test-Path $path) {
-        $BrowserPath = $path
-        break
+foreach ($AppName in "chrome.exe", "msedge.exe") {
+    foreach ($Hive in "HKCU:", "HKLM:") {
+        $AppKey = Get-ItemProperty "$Hive\SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths\$AppName" -ErrorAction SilentlyContinue
+        if ($AppKey -and $AppKey.'(default)') {
+            $AppPath = $AppKey.'(default)'.Trim('"')
+            if (Test-Path $AppPath -PathType Leaf) {
+                $BrowserPath = $AppPath
+                break
+            }
+        }
+    }
+    if ($BrowserPath) { break }
+}
+
+if (-not $BrowserPath) {
+    $BrowserPaths = @(
+        "$env:ProgramFiles\Google\Chrome\Application\chrome.exe",
+        "${env:ProgramFiles(x86)}\Google\Chrome\Application\chrome.exe",
+        "$env:LocalAppData\Google\Chrome\Application\chrome.exe",
+        "$env:ProgramFiles\Microsoft\Edge\Application\msedge.exe",
+        "${env:ProgramFiles(x86)}\Microsoft\Edge\Application\msedge.exe"
+    )
+
+    foreach ($path in $BrowserPaths) {
+        if (Test-Path $path) {
+            $BrowserPath = $path
+            break
+        }
     }
 }
 
@@ -101,17 +152,17 @@ if ($BrowserPath) {
     Read-Host
 }
 
-# Cleanup: Kill the server process tree
-try {
-    # Get child processes
-    $ChildProcesses = Get-CimInstance Win32_Process | Where-Object { $_.ParentProcessId -eq $ServerProcess.Id }
-    foreach ($child in $ChildProcesses) {
-        Stop-Process -Id $child.ProcessId -Force -ErrorAction SilentlyContinue
-    }
-    Stop-Process -Id $ServerProcess.Id -Force -ErrorAction SilentlyContinue
+# Cleanup: Kill the whole server process tree (npm -> concurrently -> vite/tsx)
+# Relax "Stop" so Windows PowerShell does not turn taskkill's stderr into a terminating error
+$ErrorActionPreference = "Continue"
+& taskkill.exe /PID $ServerProcess.Id /T /F 2>$null | Out-Null
+$ErrorActionPreference = "Stop"
+
+# 128 means the process had already exited
+if ($LASTEXITCODE -eq 0 -or $LASTEXITCODE -eq 128) {
     Write-Host "  Servers stopped successfully." -ForegroundColor Green
-} catch {
-    # Process may have already exited
+} else {
+    Write-Host "  [WARNING] Could not stop all server processes (taskkill exit code $LASTEXITCODE)" -ForegroundColor Yellow
 }
 
 Write-Host "  Goodbye!" -ForegroundColor Cyan
@@ -97,6 +97,23 @@ const ALCHEMY_CONFIG = {
   },
 };
 
+// Shared client, created on first use: dotenv.config() in server.ts runs
+// after this module is imported, so the key cannot be read at load time
+let geminiClient: GoogleGenAI | null = null;
+
+/**
+ * Get the shared Gemini client, or null if no API key is configured
+ */
+const getClient = (): GoogleGenAI | null => {
+  if (!geminiClient) {
+    const apiKey = process.env.GEMINI_API_KEY || process.env.API_KEY;
+    if (apiKey && apiKey.trim() !== '') {
+      geminiClient = new GoogleGenAI({ apiKey });
+    }
+  }
+  return geminiClient;
+};
+
 /**
  * Analyze image and detect objects/photos
  */
@@ -106,17 +123,15 @@ export const analyzeImage = async (
   expectedCount: number | null,
   logs: string[] = []
 ): Promise<DetectedCrop[]> => {
-  const apiKey = process.env.GEMINI_API_KEY || process.env.API_KEY;
+  const ai = getClient();
 
-  if (!apiKey || apiKey.trim() === '') {
+  if (!ai) {
     const msg = '[ERROR] Gemini API key not configured. Please set GEMINI_API_KEY in .env file.';
     logger.error(msg);
     logs.push(msg);
     throw new Error('API key not configured');
   }
 
-  const ai = new GoogleGenAI({ apiKey });
-
   // Get file info and convert to base64
   const mimeType = getMimeType(filePath);
   let base64Data: string;
@@ -256,15 +271,14 @@ export const analyzeImage = async (
  * Restore/enhance an image using AI
  */
 export const restoreImage = async (base64Data: string, mimeType: string = 'image/png'): Promise<string> => {
-  const apiKey = process.env.GEMINI_API_KEY || process.env.API_KEY;
+  const ai = getClient();
 
-  if (!apiKey || apiKey.trim() === '') {
+  if (!ai) {
     const msg = '[ERROR] Gemini API key not configured';
     logger.error(msg);
     throw new Error('API key not configured');
   }
 
-  const ai = new GoogleGenAI({ apiKey });
   const cleanBase64 = base64Data.replace(/^data:image\/\w+;base64,/, '');
 
   // Construct prompt from config
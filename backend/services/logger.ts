@@ -36,6 +36,7 @@ const logger = winston.createLogger({
       filename: path.join(__dirname, '../logs/api.log'),
       maxsize: 5242880, // 5MB
       maxFiles: 5,
+      lazy: true, // Open on first write
     }),
     // File transport for errors only
     new winston.transports.File({
@@ -43,6 +44,7 @@ const logger = winston.createLogger({
       level: 'error',
       maxsize: 5242880, // 5MB
       maxFiles: 5,
+      lazy: true, // Usually never written on a clean run
     }),
   ],
 });